@@ -0,0 +1,126 @@
+# asr_backends.py
+# 동작:
+#   - analyze_segments()에서 사용할 음성 인식(ASR) 백엔드 모음
+#   - 모든 백엔드는 openai-whisper의 transcribe() 결과와 같은 형태를 반환합니다.
+#       {"text": str,
+#        "segments": [{"id", "start", "end", "text",
+#                      "words": [{"word", "start", "end"}]}]}
+#
+# 백엔드:
+#   - "whisper"        : openai-whisper (기준 구현, fp32)
+#   - "faster-whisper" : CTranslate2 기반 faster-whisper, CPU int8 양자화
+#
+# 메모:
+#   - faster-whisper는 `pip install "faster-whisper>=1.1"`로 설치합니다. ("turbo" 모델 이름은 1.1부터 지원)
+#     처음 사용할 때 모델을 내려받습니다.
+#   - 스레드 수(cpu_threads)와 빔 크기(beam_size)로 CPU 노드별 속도/정확도를 조절합니다.
+#   - beam_size 기본값은 백엔드마다 다릅니다: whisper는 greedy(기존 동작 유지), faster-whisper는 5.
+#     같은 조건으로 비교하려면 beam_size를 명시하세요.
+#   - whisper의 cpu_threads는 torch 전역 설정이므로 transcribe() 동안만 바꾸고 끝나면 원래 값으로 되돌립니다.
+
+from abc import ABC, abstractmethod
+
+DEFAULT_MODEL_NAME = "turbo"
+DEFAULT_BEAM_SIZE = 5
+
+
+class ASRBackend(ABC):
+    """transcribe(audio_path, language)만 구현하면 되는 백엔드 기본 클래스"""
+
+    name = "base"
+    # 실제로 사용하는 설정값 (벤치마크 리포트에 표시)
+    beam_size = None
+    cpu_threads = None
+
+    @abstractmethod
+    def transcribe(self, audio_path: str, language="ko") -> dict:
+        ...
+
+
+class WhisperBackend(ASRBackend):
+    name = "whisper"
+
+    def __init__(self, model_name=DEFAULT_MODEL_NAME, beam_size=None, cpu_threads=None):
+        import whisper
+
+        # beam_size=None 이면 openai-whisper 기본(greedy) 디코딩
+        self.beam_size = beam_size
+        # cpu_threads=None 이면 torch 기본 스레드 수를 그대로 사용
+        self.cpu_threads = cpu_threads
+        self.model = whisper.load_model(model_name)
+
+    def transcribe(self, audio_path: str, language="ko") -> dict:
+        options = {"beam_size": self.beam_size} if self.beam_size else {}
+
+        if self.cpu_threads:
+            import torch
+
+            prev_threads = torch.get_num_threads()
+            torch.set_num_threads(self.cpu_threads)
+        try:
+            result = self.model.transcribe(audio_path, language=language, word_timestamps=True, **options)
+        finally:
+            if self.cpu_threads:
+                torch.set_num_threads(prev_threads)
+
+        segments = []
+        for seg in result["segments"]:
+            segments.append({
+                "id": seg["id"],
+                "start": seg["start"],
+                "end": seg["end"],
+                "text": seg["text"],
+                "words": [
+                    {"word": w["word"], "start": w["start"], "end": w["end"]}
+                    for w in seg.get("words", [])
+                ],
+            })
+        return {"text": result["text"], "segments": segments}
+
+
+class FasterWhisperBackend(ASRBackend):
+    name = "faster-whisper"
+
+    def __init__(self, model_name=DEFAULT_MODEL_NAME, beam_size=None, cpu_threads=None, compute_type="int8"):
+        from faster_whisper import WhisperModel
+
+        self.beam_size = beam_size or DEFAULT_BEAM_SIZE
+        # cpu_threads=0 이면 CTranslate2 기본값(코어 수 기준)을 사용
+        self.cpu_threads = cpu_threads or 0
+        self.model = WhisperModel(
+            model_name, device="cpu", compute_type=compute_type, cpu_threads=self.cpu_threads
+        )
+
+    def transcribe(self, audio_path: str, language="ko") -> dict:
+        seg_iter, _ = self.model.transcribe(
+            audio_path, language=language, beam_size=self.beam_size, word_timestamps=True
+        )
+
+        segments, texts = [], []
+        # faster-whisper는 제너레이터를 반환하므로 여기서 실제 디코딩이 수행됩니다.
+        for i, seg in enumerate(seg_iter):
+            texts.append(seg.text)
+            segments.append({
+                "id": i,
+                "start": seg.start,
+                "end": seg.end,
+                "text": seg.text,
+                "words": [
+                    {"word": w.word, "start": w.start, "end": w.end}
+                    for w in (seg.words or [])
+                ],
+            })
+        return {"text": "".join(texts), "segments": segments}
+
+
+BACKENDS = {
+    WhisperBackend.name: WhisperBackend,
+    FasterWhisperBackend.name: FasterWhisperBackend,
+}
+
+
+def load_backend(name="whisper", model_name=None, beam_size=None, cpu_threads=None) -> ASRBackend:
+    """이름으로 백엔드 생성 (예: load_backend("faster-whisper", cpu_threads=8, beam_size=1))"""
+    if name not in BACKENDS:
+        raise ValueError(f"Unknown ASR backend: {name} (available: {', '.join(BACKENDS)})")
+    return BACKENDS[name](model_name=model_name or DEFAULT_MODEL_NAME, beam_size=beam_size, cpu_threads=cpu_threads)
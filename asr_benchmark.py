@@ -0,0 +1,140 @@
+# asr_benchmark.py
+# 사용법(예):
+#   python asr_benchmark.py --refdir "./asr_ref" --backend whisper --backend faster-whisper:threads=8,beam=1
+#
+# 동작:
+#   - 참조 폴더의 음성 파일(<stem>.wav/.m4a/.mp3)과 정답 전사(<stem>.txt)를 짝지어
+#   - 백엔드 설정별로 WER/CER(정확도)과 실시간 배율(속도)을 측정해 표로 출력
+#   - --out 지정 시 결과를 JSON으로 저장
+#
+# 메모:
+#   - 백엔드 설정 형식: <이름>[:threads=N,beam=N,model=이름]
+#   - RTF(real-time factor) = 전사 시간 / 음성 길이. 1보다 작을수록 실시간보다 빠릅니다.
+#   - 한국어는 띄어쓰기 차이가 WER에 크게 반영되므로 CER도 함께 확인하세요.
+#   - 각 행에는 실제로 사용된 beam/threads 값이 표시됩니다. (greedy: beam search 없음, auto: 기본 스레드 수)
+#   - 백엔드마다 beam 기본값이 다르므로(whisper: greedy, faster-whisper: 5) 기본 비교는 양쪽 모두 beam=5로 맞춥니다.
+#   - 음성 길이 계산에 librosa>=0.10이 필요하며, .m4a는 ffmpeg(audioread)로 읽습니다.
+
+import argparse
+import json
+import re
+import time
+from pathlib import Path
+
+from asr_backends import load_backend
+
+AUDIO_EXTS = (".wav", ".m4a", ".mp3", ".flac")
+
+
+def normalize(text: str) -> str:
+    """문장부호 제거 + 공백 정리"""
+    text = re.sub(r"[^\w\s]", " ", text.lower())
+    return " ".join(text.split())
+
+
+def edit_distance(ref: list, hyp: list) -> int:
+    prev = list(range(len(hyp) + 1))
+    for i, r in enumerate(ref, 1):
+        cur = [i] + [0] * len(hyp)
+        for j, h in enumerate(hyp, 1):
+            cur[j] = min(prev[j] + 1, cur[j - 1] + 1, prev[j - 1] + (r != h))
+        prev = cur
+    return prev[-1]
+
+
+def load_reference_set(refdir: Path):
+    pairs = []
+    for audio in sorted(refdir.iterdir()):
+        if audio.suffix.lower() not in AUDIO_EXTS:
+            continue
+        txt = audio.with_suffix(".txt")
+        if txt.exists():
+            pairs.append((audio, txt.read_text(encoding="utf-8")))
+    if not pairs:
+        raise RuntimeError(f"No <audio>/<stem>.txt pairs found in {refdir}")
+    return pairs
+
+
+def parse_backend_spec(spec: str) -> dict:
+    name, _, opts = spec.partition(":")
+    config = {"name": name, "model_name": None, "beam_size": None, "cpu_threads": None}
+    for opt in filter(None, opts.split(",")):
+        key, _, value = opt.partition("=")
+        if key == "threads":
+            config["cpu_threads"] = int(value)
+        elif key == "beam":
+            config["beam_size"] = int(value)
+        elif key == "model":
+            config["model_name"] = value
+        else:
+            raise ValueError(f"Unknown backend option: {key}")
+    return config
+
+
+def benchmark(spec: str, pairs, language="ko") -> dict:
+    import librosa  # 오디오 의존성은 실제 측정할 때만 필요
+
+    config = parse_backend_spec(spec)
+    t0 = time.perf_counter()
+    backend = load_backend(**config)
+    load_sec = time.perf_counter() - t0
+
+    word_err = word_total = char_err = char_total = 0
+    audio_sec = asr_sec = 0.0
+    for audio, ref_text in pairs:
+        audio_sec += librosa.get_duration(path=str(audio))
+        t0 = time.perf_counter()
+        hyp_text = backend.transcribe(str(audio), language=language)["text"]
+        asr_sec += time.perf_counter() - t0
+
+        ref, hyp = normalize(ref_text), normalize(hyp_text)
+        word_err += edit_distance(ref.split(), hyp.split())
+        word_total += len(ref.split())
+        char_err += edit_distance(list(ref.replace(" ", "")), list(hyp.replace(" ", "")))
+        char_total += len(ref.replace(" ", ""))
+
+    return {
+        "backend": spec,
+        "beam_size": backend.beam_size,
+        "cpu_threads": backend.cpu_threads,
+        "files": len(pairs),
+        "wer": word_err / word_total if word_total else 0.0,
+        "cer": char_err / char_total if char_total else 0.0,
+        "audio_sec": round(audio_sec, 2),
+        "asr_sec": round(asr_sec, 2),
+        "rtf": asr_sec / audio_sec if audio_sec else 0.0,
+        "load_sec": round(load_sec, 2),
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="ASR 백엔드별 정확도(WER/CER) 대비 속도(RTF) 비교")
+    parser.add_argument("--refdir", required=True, help="음성 파일과 같은 이름의 .txt 정답 전사가 있는 폴더")
+    parser.add_argument("--backend", action="append", default=None,
+                        help="백엔드 설정 (여러 번 지정 가능, 예: faster-whisper:threads=8,beam=1)")
+    parser.add_argument("--language", default="ko")
+    parser.add_argument("--out", default=None, help="결과 JSON 저장 경로")
+    args = parser.parse_args()
+
+    pairs = load_reference_set(Path(args.refdir))
+    specs = args.backend or ["whisper:beam=5", "faster-whisper:beam=5"]
+
+    reports = []
+    for spec in specs:
+        print(f">> {spec} ({len(pairs)} files)")
+        reports.append(benchmark(spec, pairs, args.language))
+
+    print(f"\n{'backend':<40} {'beam':>6} {'threads':>8} {'WER':>7} {'CER':>7} {'RTF':>7} {'load(s)':>8}")
+    for r in reports:
+        beam = r["beam_size"] or "greedy"
+        threads = r["cpu_threads"] or "auto"
+        print(f"{r['backend']:<40} {beam:>6} {threads:>8} "
+              f"{r['wer']:>7.3f} {r['cer']:>7.3f} {r['rtf']:>7.3f} {r['load_sec']:>8.2f}")
+
+    if args.out:
+        with open(args.out, "w", encoding="utf-8") as f:
+            json.dump(reports, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,12 +1,20 @@
 # app/utils/audio_analyzer.py
-import whisper
 import librosa
 import numpy as np
 
+from asr_backends import ASRBackend, load_backend
 
-def analyze_segments(audio_path: str, model_name="turbo", language="ko"):
-    model = whisper.load_model(model_name)
-    result = model.transcribe(audio_path, language=language, word_timestamps=True)
+
+def analyze_segments(audio_path: str, model_name=None, language="ko",
+                     backend="whisper", beam_size=None, cpu_threads=None):
+    # backend: "whisper" | "faster-whisper" 또는 이미 로드된 ASRBackend 인스턴스
+    # (인스턴스를 넘길 때는 로드 시점에 설정이 정해지므로 model_name/beam_size/cpu_threads를 함께 줄 수 없음)
+    if isinstance(backend, ASRBackend):
+        if model_name is not None or beam_size is not None or cpu_threads is not None:
+            raise ValueError("model_name/beam_size/cpu_threads cannot be set when passing a loaded ASRBackend")
+    else:
+        backend = load_backend(backend, model_name=model_name, beam_size=beam_size, cpu_threads=cpu_threads)
+    result = backend.transcribe(audio_path, language=language)
     y, sr = librosa.load(audio_path, sr=16000)
 
     analyzed = []
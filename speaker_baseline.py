@@ -0,0 +1,293 @@
+# speaker_baseline.py
+# 사용법(예):
+#   python speaker_baseline.py --index baseline.json --language ko --context 발표 result.json result2.json
+#   python speaker_baseline.py --index baseline.json --merge worker1.json worker2.json
+#
+# 워커 병합 방식:
+#   - 각 워커는 "빈" 인덱스(worker1.json 등)에서 시작해 새 결과만 누적하고, 전역 인덱스에 --merge로 합칩니다.
+#   - 전역 인덱스를 복사해서 시작한 워커 인덱스는 같은 source를 공유하므로 병합이 거부됩니다(ValueError).
+#     (카운트만 남는 스케치라 공유 부분을 빼낼 수 없어, 두 번 세는 대신 오류로 알림)
+#
+# 동작:
+#   - analyze_segments() 결과(JSON) 하나를 "녹음(화자) 1건"으로 보고, 지표별로 구간 값의 중앙값을
+#     코호트(language, context)에 누적 -> 구간이 많은 긴 녹음이 기준값을 독점하지 않음
+#   - 지표(pitch, dB, 속도, 휴지 비율)마다 고정 구간 히스토그램 스케치를 유지
+#     -> 과거 결과 파일을 다시 읽지 않고도 중앙값/백분위 조회 가능
+#   - 스케치는 카운트만 더하면 되므로 다른 워커에서 만든 인덱스도 그대로 병합 가능
+#   - 누적한 결과의 source id(CLI는 파일 내용 sha256)를 기록해 같은 결과를 두 번 세지 않음
+#
+# 메모:
+#   - 히스토그램 구간 수가 고정이라 조회 비용은 데이터 양과 무관(상수 시간)합니다.
+#   - 범위를 벗어난 값은 양 끝 구간에 포함되며, underflow/overflow 카운트로 따로 기록됩니다.
+#   - 단위 주의: clova_LLM.py 프롬프트의 볼륨은 절대 dB(예: 68)지만 analyze_segments의 dB는
+#     구간 최대값 기준 상대 dB(항상 0 이하)입니다. 같은 기준끼리만 비교하세요.
+#   - 말하기 속도는 rate_wpm(단어/분)과 syllables_per_sec(한글 음절/초)를 모두 저장합니다.
+#   - 스케치 크기는 고정이지만 source id 목록은 누적한 결과 수만큼 늘어납니다(결과 1건당 sha256 1개).
+
+import argparse
+import hashlib
+import json
+import re
+from bisect import bisect_left, bisect_right
+from pathlib import Path
+from statistics import median
+
+# 지표별 (최소, 최대) 범위. dB는 analyze_segments에서 ref=np.max 기준이라 0 이하입니다.
+METRIC_RANGES = {
+    "pitch_mean_hz": (50.0, 1000.0),
+    "dB": (-80.0, 0.0),
+    "rate_wpm": (0.0, 600.0),
+    "syllables_per_sec": (0.0, 15.0),
+    "pause_ratio": (0.0, 1.0),
+}
+NUM_BINS = 400
+
+HANGUL_SYLLABLE = re.compile(r"[\uac00-\ud7a3]")
+
+
+def syllables_per_sec(seg):
+    """구간 텍스트의 한글 음절 수 / 구간 길이(초). 계산할 수 없으면 None"""
+    duration = seg.get("end", 0) - seg.get("start", 0)
+    syllables = len(HANGUL_SYLLABLE.findall(seg.get("text", "")))
+    if duration <= 0 or syllables == 0:
+        return None
+    return syllables / duration
+
+
+class QuantileSketch:
+    """고정 구간 히스토그램 기반의 병합 가능한 분위수 스케치"""
+
+    def __init__(self, lo, hi, bins=NUM_BINS, counts=None, underflow=0, overflow=0):
+        self.lo = float(lo)
+        self.hi = float(hi)
+        self.bins = int(bins)
+        self.width = (self.hi - self.lo) / self.bins
+        self.counts = list(counts) if counts is not None else [0] * self.bins
+        # 범위를 벗어나 양 끝 구간으로 들어간 값의 수
+        self.underflow = underflow
+        self.overflow = overflow
+        self._cum = None
+
+    @property
+    def count(self):
+        return sum(self.counts) if self._cum is None else self._cum[-1]
+
+    def _bin(self, value):
+        idx = int((value - self.lo) / self.width)
+        return min(max(idx, 0), self.bins - 1)
+
+    def _cumulative(self):
+        if self._cum is None:
+            cum, total = [], 0
+            for c in self.counts:
+                total += c
+                cum.append(total)
+            self._cum = cum
+        return self._cum
+
+    def add(self, value, weight=1):
+        if value < self.lo:
+            self.underflow += weight
+        elif value > self.hi:
+            self.overflow += weight
+        self.counts[self._bin(value)] += weight
+        self._cum = None
+
+    def merge(self, other):
+        if (self.lo, self.hi, self.bins) != (other.lo, other.hi, other.bins):
+            raise ValueError("Cannot merge sketches with different ranges or bin counts")
+        self.counts = [a + b for a, b in zip(self.counts, other.counts)]
+        self.underflow += other.underflow
+        self.overflow += other.overflow
+        self._cum = None
+        return self
+
+    def quantile(self, q):
+        """q(0~1) 분위수 값 (구간 내부는 선형 보간)"""
+        cum = self._cumulative()
+        total = cum[-1]
+        if total == 0:
+            return None
+        target = min(max(q, 0.0), 1.0) * total
+        if target == 0:
+            # q=0: 값이 들어 있는 첫 구간 (빈 구간 건너뜀)
+            idx = bisect_right(cum, 0)
+        else:
+            idx = min(bisect_left(cum, target), self.bins - 1)
+        prev = cum[idx - 1] if idx > 0 else 0
+        in_bin = self.counts[idx]
+        frac = (target - prev) / in_bin if in_bin else 0.0
+        return self.lo + (idx + frac) * self.width
+
+    def percentile_of(self, value):
+        """value가 분포에서 차지하는 백분위(0~100)"""
+        cum = self._cumulative()
+        total = cum[-1]
+        if total == 0:
+            return None
+        idx = self._bin(value)
+        prev = cum[idx - 1] if idx > 0 else 0
+        frac = (value - (self.lo + idx * self.width)) / self.width
+        frac = min(max(frac, 0.0), 1.0)
+        return 100.0 * (prev + frac * self.counts[idx]) / total
+
+    def to_dict(self):
+        return {
+            "lo": self.lo, "hi": self.hi, "bins": self.bins, "counts": self.counts,
+            "underflow": self.underflow, "overflow": self.overflow,
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        return cls(data["lo"], data["hi"], data["bins"], data["counts"],
+                   data.get("underflow", 0), data.get("overflow", 0))
+
+
+class SpeakerBaselineIndex:
+    """코호트(language, context)별 평균 화자 기준값 인덱스"""
+
+    def __init__(self):
+        self.cohorts = {}
+        # 이미 누적한 결과의 source id
+        self.sources = set()
+
+    def _sketches(self, language, context):
+        key = (language, context)
+        if key not in self.cohorts:
+            self.cohorts[key] = {
+                name: QuantileSketch(lo, hi) for name, (lo, hi) in METRIC_RANGES.items()
+            }
+        return self.cohorts[key]
+
+    def ingest(self, result, language="ko", context="default", source_id=None):
+        """analyze_segments() 결과 하나(녹음 1건)를 누적. 이미 누적한 source_id면 건너뛰고 False 반환"""
+        if source_id is not None:
+            if source_id in self.sources:
+                return False
+            self.sources.add(source_id)
+
+        values = {name: [] for name in METRIC_RANGES}
+        for seg in result.get("segments", []):
+            metrics = dict(seg.get("metrics", {}))
+            metrics["syllables_per_sec"] = syllables_per_sec(seg)
+            for name in values:
+                value = metrics.get(name)
+                if value is None:
+                    continue
+                # 유성음이 없는 구간은 pitch가 0.0으로 기록되므로 제외
+                if name == "pitch_mean_hz" and value <= 0:
+                    continue
+                values[name].append(float(value))
+
+        # 녹음마다 지표별 중앙값 1개만 반영 (화자 단위 가중치)
+        sketches = self._sketches(language, context)
+        for name, vals in values.items():
+            if vals:
+                sketches[name].add(median(vals))
+        return True
+
+    def merge(self, other):
+        overlap = self.sources & other.sources
+        if overlap:
+            raise ValueError(f"Indexes share {len(overlap)} ingested sources; merging would double count them")
+        self.sources |= other.sources
+        for (language, context), other_sketches in other.cohorts.items():
+            sketches = self._sketches(language, context)
+            for name, sketch in other_sketches.items():
+                sketches[name].merge(sketch)
+        return self
+
+    @staticmethod
+    def _check_metric(metric):
+        if metric not in METRIC_RANGES:
+            raise ValueError(f"Unknown metric: {metric} (available: {', '.join(METRIC_RANGES)})")
+
+    def baseline(self, metric, language="ko", context="default", q=0.5):
+        """코호트의 분위수 값 (기본: 중앙값). 데이터가 없으면 None"""
+        self._check_metric(metric)
+        sketches = self.cohorts.get((language, context))
+        if sketches is None:
+            return None
+        return sketches[metric].quantile(q)
+
+    def delta(self, metric, value, language="ko", context="default", q=0.5):
+        """value - 코호트 분위수 값 (예: 210 Hz, 중앙값 180 Hz -> +30)"""
+        base = self.baseline(metric, language, context, q)
+        return None if base is None else value - base
+
+    def percentile(self, metric, value, language="ko", context="default"):
+        """value가 코호트 분포에서 차지하는 백분위(0~100). 데이터가 없으면 None"""
+        self._check_metric(metric)
+        sketches = self.cohorts.get((language, context))
+        if sketches is None:
+            return None
+        return sketches[metric].percentile_of(value)
+
+    def to_dict(self):
+        return {
+            "sources": sorted(self.sources),
+            "cohorts": [
+                {
+                    "language": language,
+                    "context": context,
+                    "metrics": {name: s.to_dict() for name, s in sketches.items()},
+                }
+                for (language, context), sketches in self.cohorts.items()
+            ]
+        }
+
+    @classmethod
+    def from_dict(cls, data):
+        index = cls()
+        index.sources = set(data.get("sources", []))
+        for cohort in data.get("cohorts", []):
+            key = (cohort["language"], cohort["context"])
+            sketches = index._sketches(*key)
+            for name, s in cohort["metrics"].items():
+                sketches[name] = QuantileSketch.from_dict(s)
+        return index
+
+    def save(self, path):
+        with open(path, "w", encoding="utf-8") as f:
+            json.dump(self.to_dict(), f, ensure_ascii=False)
+
+    @classmethod
+    def load(cls, path):
+        with open(path, "r", encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="analyze_segments 결과로 코호트별 화자 기준값 인덱스 갱신")
+    parser.add_argument("inputs", nargs="+", help="analyze_segments 결과 JSON (--merge 시 인덱스 JSON)")
+    parser.add_argument("--index", required=True, help="갱신할 인덱스 파일 (없으면 새로 생성)")
+    parser.add_argument("--language", default="ko")
+    parser.add_argument("--context", default="default", help="발화 상황 (예: 발표, 면접)")
+    parser.add_argument("--merge", action="store_true", help="입력 파일을 인덱스로 보고 병합")
+    args = parser.parse_args()
+
+    index_path = Path(args.index)
+    index = SpeakerBaselineIndex.load(index_path) if index_path.exists() else SpeakerBaselineIndex()
+
+    for path in args.inputs:
+        if args.merge:
+            index.merge(SpeakerBaselineIndex.load(path))
+        else:
+            raw = Path(path).read_bytes()
+            source_id = hashlib.sha256(raw).hexdigest()
+            if not index.ingest(json.loads(raw), args.language, args.context, source_id):
+                print(f"skip (already ingested): {path}")
+
+    index.save(index_path)
+
+    for (language, context), sketches in index.cohorts.items():
+        medians = {name: s.quantile(0.5) for name, s in sketches.items()}
+        summary = ", ".join(
+            f"{name}={v:.2f}" if v is not None else f"{name}=-" for name, v in medians.items()
+        )
+        clipped = sum(s.underflow + s.overflow for s in sketches.values())
+        print(f"[{language}/{context}] n={sketches['dB'].count} clipped={clipped} median: {summary}")
+
+
+if __name__ == "__main__":
+    main()
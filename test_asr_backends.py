@@ -0,0 +1,100 @@
+import sys
+from types import SimpleNamespace
+
+import pytest
+
+from asr_backends import ASRBackend, FasterWhisperBackend, WhisperBackend, load_backend
+
+
+class FakeWhisperModel:
+    def __init__(self):
+        self.calls = []
+
+    def transcribe(self, audio_path, language, word_timestamps, **options):
+        self.calls.append(options)
+        return {
+            "text": " 안녕하세요 반갑습니다",
+            "segments": [{
+                "id": 0, "seek": 0, "start": 0.0, "end": 1.5, "text": " 안녕하세요 반갑습니다",
+                "tokens": [1, 2], "avg_logprob": -0.1,
+                "words": [
+                    {"word": " 안녕하세요", "start": 0.0, "end": 0.7, "probability": 0.9},
+                    {"word": " 반갑습니다", "start": 0.8, "end": 1.5, "probability": 0.9},
+                ],
+            }],
+        }
+
+
+class FakeFasterWhisperModel:
+    def transcribe(self, audio_path, language, beam_size, word_timestamps):
+        words = [
+            SimpleNamespace(word=" 안녕하세요", start=0.0, end=0.7, probability=0.9),
+            SimpleNamespace(word=" 반갑습니다", start=0.8, end=1.5, probability=0.9),
+        ]
+        seg = SimpleNamespace(id=1, start=0.0, end=1.5, text=" 안녕하세요 반갑습니다", words=words)
+        return iter([seg]), SimpleNamespace(language=language)
+
+
+def make_backend(cls, model, beam_size=5, cpu_threads=None):
+    # 실제 모델을 로드하지 않고 가짜 모델만 주입
+    backend = cls.__new__(cls)
+    backend.model = model
+    backend.beam_size = beam_size
+    backend.cpu_threads = cpu_threads
+    return backend
+
+
+def schema(result):
+    """키와 값의 타입으로 결과 구조를 요약"""
+    def shape(d):
+        return {k: type(v).__name__ for k, v in d.items() if k not in ("segments", "words")}
+
+    seg = result["segments"][0]
+    return shape(result), shape(seg), shape(seg["words"][0])
+
+
+def test_backends_produce_same_schema():
+    whisper_result = make_backend(WhisperBackend, FakeWhisperModel()).transcribe("x.wav")
+    faster_result = make_backend(FasterWhisperBackend, FakeFasterWhisperModel()).transcribe("x.wav")
+
+    assert schema(whisper_result) == schema(faster_result)
+    assert set(whisper_result) == {"text", "segments"}
+    assert set(whisper_result["segments"][0]) == {"id", "start", "end", "text", "words"}
+    assert set(whisper_result["segments"][0]["words"][0]) == {"word", "start", "end"}
+    assert whisper_result["text"] == faster_result["text"]
+
+
+def test_whisper_defaults_to_greedy_decoding(monkeypatch):
+    model = FakeWhisperModel()
+    monkeypatch.setitem(sys.modules, "whisper", SimpleNamespace(load_model=lambda name: model))
+
+    load_backend("whisper").transcribe("x.wav")
+    load_backend("whisper", beam_size=3).transcribe("x.wav")
+    assert model.calls == [{}, {"beam_size": 3}]
+
+
+def test_whisper_restores_torch_threads(monkeypatch):
+    threads = {"n": 16}
+    seen = []
+    fake_torch = SimpleNamespace(
+        get_num_threads=lambda: threads["n"],
+        set_num_threads=lambda n: threads.update(n=n),
+    )
+    monkeypatch.setitem(sys.modules, "torch", fake_torch)
+
+    model = FakeWhisperModel()
+    original = model.transcribe
+    model.transcribe = lambda *a, **kw: seen.append(threads["n"]) or original(*a, **kw)
+    make_backend(WhisperBackend, model, cpu_threads=2).transcribe("x.wav")
+    assert seen == [2]
+    assert threads["n"] == 16
+
+
+def test_base_backend_is_abstract():
+    with pytest.raises(TypeError):
+        ASRBackend()
+
+
+def test_load_backend_rejects_unknown_name():
+    with pytest.raises(ValueError):
+        load_backend("nope")
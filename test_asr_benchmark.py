@@ -0,0 +1,30 @@
+import pytest
+
+from asr_benchmark import edit_distance, normalize, parse_backend_spec
+
+
+def test_normalize():
+    assert normalize("  안녕하세요,  반갑습니다! Hello.") == "안녕하세요 반갑습니다 hello"
+
+
+def test_edit_distance():
+    assert edit_distance([], []) == 0
+    assert edit_distance(["a", "b", "c"], ["a", "b", "c"]) == 0
+    assert edit_distance(["a", "b", "c"], ["a", "x", "c"]) == 1
+    assert edit_distance(["a", "b", "c"], ["a", "c"]) == 1
+    assert edit_distance(["a"], ["a", "b", "c"]) == 2
+    assert edit_distance(list("kitten"), list("sitting")) == 3
+
+
+def test_parse_backend_spec():
+    assert parse_backend_spec("whisper") == {
+        "name": "whisper", "model_name": None, "beam_size": None, "cpu_threads": None,
+    }
+    assert parse_backend_spec("faster-whisper:threads=8,beam=1,model=small") == {
+        "name": "faster-whisper", "model_name": "small", "beam_size": 1, "cpu_threads": 8,
+    }
+
+
+def test_parse_backend_spec_rejects_unknown_option():
+    with pytest.raises(ValueError):
+        parse_backend_spec("whisper:temperature=0")
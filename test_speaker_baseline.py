@@ -0,0 +1,122 @@
+import pytest
+
+from speaker_baseline import QuantileSketch, SpeakerBaselineIndex, syllables_per_sec
+
+
+def make_result(pitches, db=-20.0, rate=150.0, pause=0.1, text="안녕하세요", seg_len=1.0):
+    segments = []
+    for i, pitch in enumerate(pitches):
+        segments.append({
+            "id": i,
+            "text": text,
+            "start": i * seg_len,
+            "end": (i + 1) * seg_len,
+            "metrics": {"pitch_mean_hz": pitch, "dB": db, "rate_wpm": rate, "pause_ratio": pause},
+        })
+    return {"segments": segments}
+
+
+def test_quantile_and_percentile():
+    sketch = QuantileSketch(0, 100, bins=100)
+    for v in range(100):
+        sketch.add(v + 0.5)
+    assert sketch.quantile(0.5) == pytest.approx(50, abs=1)
+    assert sketch.quantile(0.9) == pytest.approx(90, abs=1)
+    assert sketch.percentile_of(25) == pytest.approx(25, abs=1)
+    assert QuantileSketch(0, 1).quantile(0.5) is None
+
+
+def test_quantile_zero_skips_empty_bins():
+    sketch = QuantileSketch(50, 1000)
+    for v in (180, 200, 220):
+        sketch.add(v)
+    assert sketch.quantile(0) == pytest.approx(180, abs=sketch.width)
+    assert sketch.quantile(1) == pytest.approx(220, abs=sketch.width)
+
+
+def test_out_of_range_values_are_counted():
+    sketch = QuantileSketch(0, 10)
+    sketch.add(-5)
+    sketch.add(5)
+    sketch.add(50)
+    assert (sketch.underflow, sketch.overflow, sketch.count) == (1, 1, 3)
+
+
+def test_merge_rejects_different_ranges():
+    with pytest.raises(ValueError):
+        QuantileSketch(0, 10).merge(QuantileSketch(0, 20))
+
+
+def test_ingest_is_per_recording_and_skips_unvoiced_pitch():
+    index = SpeakerBaselineIndex()
+    # 구간이 많은 녹음도 중앙값 1개로만 반영
+    index.ingest(make_result([300.0] * 50 + [0.0] * 10))
+    index.ingest(make_result([150.0]))
+    index.ingest(make_result([160.0]))
+    sketch = index.cohorts[("ko", "default")]["pitch_mean_hz"]
+    assert sketch.count == 3
+    assert index.baseline("pitch_mean_hz") == pytest.approx(160, abs=sketch.width)
+    assert index.delta("pitch_mean_hz", 190) == pytest.approx(30, abs=sketch.width)
+    assert index.baseline("pitch_mean_hz", context="면접") is None
+
+
+def test_ingest_skips_known_source():
+    index = SpeakerBaselineIndex()
+    assert index.ingest(make_result([200.0]), source_id="a")
+    assert not index.ingest(make_result([200.0]), source_id="a")
+    assert index.cohorts[("ko", "default")]["pitch_mean_hz"].count == 1
+
+
+def test_syllables_per_sec():
+    assert syllables_per_sec({"text": "안녕하세요", "start": 0.0, "end": 2.0}) == 2.5
+    assert syllables_per_sec({"text": "hello", "start": 0.0, "end": 2.0}) is None
+    index = SpeakerBaselineIndex()
+    index.ingest(make_result([200.0], seg_len=1.0))
+    assert index.baseline("syllables_per_sec") == pytest.approx(5, abs=0.05)
+
+
+def test_merge_and_round_trip():
+    a, b = SpeakerBaselineIndex(), SpeakerBaselineIndex()
+    a.ingest(make_result([150.0]), source_id="a")
+    b.ingest(make_result([250.0]), source_id="b")
+    b.ingest(make_result([200.0]), "en", "interview", source_id="c")
+
+    merged = SpeakerBaselineIndex.from_dict(a.to_dict()).merge(SpeakerBaselineIndex.from_dict(b.to_dict()))
+    assert merged.sources == {"a", "b", "c"}
+    assert merged.cohorts[("ko", "default")]["pitch_mean_hz"].count == 2
+    assert merged.baseline("pitch_mean_hz", "en", "interview") == pytest.approx(200, abs=3)
+
+    restored = SpeakerBaselineIndex.from_dict(merged.to_dict())
+    assert restored.to_dict() == merged.to_dict()
+
+    with pytest.raises(ValueError):
+        merged.merge(a)
+
+
+def test_merge_rejects_workers_seeded_from_global_index():
+    global_index = SpeakerBaselineIndex()
+    global_index.ingest(make_result([180.0]), source_id="seed")
+
+    # 전역 인덱스를 복사해서 시작한 워커는 seed를 공유하므로 병합 거부
+    seeded = SpeakerBaselineIndex.from_dict(global_index.to_dict())
+    seeded.ingest(make_result([220.0]), source_id="new")
+    with pytest.raises(ValueError):
+        global_index.merge(seeded)
+    assert global_index.sources == {"seed"}
+
+    # 빈 인덱스에서 시작한 워커는 정상 병합
+    worker = SpeakerBaselineIndex()
+    worker.ingest(make_result([220.0]), source_id="new")
+    global_index.merge(worker)
+    assert global_index.cohorts[("ko", "default")]["pitch_mean_hz"].count == 2
+
+
+def test_unknown_metric_raises_with_or_without_data():
+    index = SpeakerBaselineIndex()
+    with pytest.raises(ValueError, match="pitch_mean_hz"):
+        index.baseline("pitch")
+    index.ingest(make_result([200.0]))
+    for call in (lambda: index.baseline("pitch"), lambda: index.delta("pitch", 1.0),
+                 lambda: index.percentile("pitch", 1.0)):
+        with pytest.raises(ValueError):
+            call()